@@ -1931,6 +1931,28 @@ class TensorDictBase(Mapping, metaclass=abc.ABCMeta):
         # if return_simple_view and not self.is_memmap():
         return self._index_tensordict(idx)
 
+    def __getitems__(self, idx: List[int]) -> TensorDictBase:
+        """Indexes the tensordict along its first dimension with a list of indices.
+
+        This hook is used by :class:`torch.utils.data.DataLoader` to retrieve a
+        whole batch with a single indexing operation (e.g. a single read from a
+        memory-mapped tensordict) instead of calling :obj:`__getitem__` once per
+        sample. The result is already batched, hence the DataLoader should be
+        given a :obj:`collate_fn` that returns its input unchanged.
+
+        .. note:: The DataLoader only calls :obj:`__getitems__` with torch>=2.0.
+            With older versions, the :obj:`collate_fn` receives a list of
+            single-sample tensordicts instead.
+
+        Examples:
+            >>> td = TensorDict({"a": torch.zeros(10, 3)}, batch_size=[10])
+            >>> dataloader = DataLoader(td, batch_size=4, collate_fn=lambda x: x)
+            >>> batch = next(iter(dataloader))
+            >>> assert batch.shape == torch.Size([4])
+
+        """
+        return self[idx]
+
     def __setitem__(
         self, index: INDEX_TYPING, value: Union[TensorDictBase, dict]
     ) -> None:
@@ -2397,10 +2419,7 @@ class TensorDict(TensorDictBase):
     def pin_memory(self) -> TensorDictBase:
         if self.device == torch.device("cpu"):
             for key, value in self.items():
-                if isinstance(value, TensorDictBase) or (
-                    value.dtype in (torch.half, torch.float, torch.double)
-                ):
-                    self.set(key, value.pin_memory(), inplace=False)
+                self.set(key, value.pin_memory(), inplace=False)
         return self
 
     def expand(self, *shape) -> TensorDictBase:
@@ -2801,9 +2820,20 @@ class TensorDict(TensorDictBase):
         return all([value.is_contiguous() for _, value in self.items()])
 
     def contiguous(self) -> TensorDictBase:
-        if not self.is_contiguous():
-            return self.clone()
-        return self
+        if self.is_contiguous():
+            return self
+        # only copy the entries that need it. Nested tensordicts go through their
+        # own contiguous() so that lazy stacks or sub-tensordicts are never
+        # written in-place.
+        return TensorDict(
+            source={
+                key: value if value.is_contiguous() else value.contiguous()
+                for key, value in self.items()
+            },
+            batch_size=self.batch_size,
+            device=self.device,
+            _run_checks=False,
+        )
 
     def select(
         self, *keys: NESTED_KEY, inplace: bool = False, strict: bool = True
@@ -11,6 +11,7 @@ import numpy as np
 import pytest
 import torch
 from _utils_internal import get_available_devices, prod, TestTensorDictsBase
+from packaging import version
 from tensordict import LazyStackedTensorDict, MemmapTensor, SavedTensorDict, TensorDict
 from tensordict.tensordict import (
     _stack as stack_td,
@@ -22,6 +23,10 @@ from tensordict.tensordict import (
 from tensordict.utils import _getitem_batch_size, convert_ellipsis_to_idx
 from torch import multiprocessing as mp
 
+_has_dataloader_getitems = version.parse(
+    version.parse(torch.__version__).base_version
+) >= version.parse("2.0.0")
+
 
 @pytest.mark.parametrize("device", get_available_devices())
 def test_tensordict_set(device):
@@ -529,6 +534,104 @@ def test_stacked_td(stack_dim, device):
     assert (std5.contiguous() == sub_td.contiguous().unbind(1)[0]).all()
 
 
+@pytest.mark.parametrize("device", get_available_devices())
+def test_contiguous_copies_only_non_contiguous(device):
+    a = torch.randn(3, 4, device=device)
+    b = torch.randn(4, 3, device=device).t()
+    td = TensorDict({"a": a, "b": b}, batch_size=[3], device=device)
+    assert not td.is_contiguous()
+    td_c = td.contiguous()
+    assert td_c.is_contiguous()
+    assert td_c is not td
+    assert td_c.get("a").data_ptr() == a.data_ptr()
+    assert td_c.get("b").data_ptr() != b.data_ptr()
+    assert (td_c.get("b") == b).all()
+    assert td_c.contiguous() is td_c
+
+
+@pytest.mark.parametrize("device", get_available_devices())
+def test_contiguous_nested(device):
+    a = torch.randn(3, 4, device=device)
+    b = torch.randn(4, 3, device=device).t()
+    nested = TensorDict({"a": a, "b": b}, batch_size=[3], device=device)
+    td = TensorDict(
+        {"c": torch.randn(3, 2, device=device), "nested": nested},
+        batch_size=[3],
+        device=device,
+    )
+    assert not td.is_contiguous()
+    td_c = td.contiguous()
+    assert td_c.is_contiguous()
+    assert td_c.get("c").data_ptr() == td.get("c").data_ptr()
+    assert td_c.get(("nested", "a")).data_ptr() == a.data_ptr()
+    assert td_c.get(("nested", "b")).data_ptr() != b.data_ptr()
+    assert (td_c.get(("nested", "b")) == b).all()
+    # the input is left untouched
+    assert nested.get("a") is a
+    assert nested.get("b") is b
+
+
+@pytest.mark.parametrize("device", get_available_devices())
+def test_contiguous_nested_lazy_stack(device):
+    sub_tds = [
+        TensorDict({"x": torch.randn(3, device=device)}, [], device=device)
+        for _ in range(2)
+    ]
+    xs = [sub_td.get("x") for sub_td in sub_tds]
+    lazy_td = LazyStackedTensorDict(*sub_tds, stack_dim=0)
+    td = TensorDict(
+        {"a": torch.randn(2, 3, device=device), "lazy": lazy_td},
+        batch_size=[2],
+        device=device,
+    )
+    assert not td.is_contiguous()
+    td_c = td.contiguous()
+    assert td_c.is_contiguous()
+    assert (td_c.get(("lazy", "x")) == torch.stack(xs, 0)).all()
+    # the sub-tensordicts of the input still hold the original tensors
+    assert td.get("lazy") is lazy_td
+    for sub_td, x in zip(lazy_td.tensordicts, xs):
+        assert sub_td.get("x") is x
+
+
+@pytest.mark.skipif(
+    not _has_dataloader_getitems,
+    reason="DataLoader only uses __getitems__ with torch>=2.0",
+)
+@pytest.mark.parametrize("td_type", ["td", "stacked_td", "memmap_td"])
+@pytest.mark.parametrize("device", get_available_devices())
+def test_getitems_dataloader(td_type, device):
+    n, batch_size = 12, 4
+    if td_type == "stacked_td":
+        td = LazyStackedTensorDict(
+            *[
+                TensorDict({"a": torch.full((3,), i, device=device)}, [])
+                for i in range(n)
+            ],
+            stack_dim=0,
+        )
+    else:
+        td = TensorDict(
+            {"a": torch.arange(n, device=device).unsqueeze(-1).repeat(1, 3)},
+            batch_size=[n],
+            device=device,
+        )
+        if td_type == "memmap_td":
+            td.memmap_()
+
+    dataloader = torch.utils.data.DataLoader(
+        td, batch_size=batch_size, collate_fn=lambda x: x
+    )
+    num_batches = 0
+    for i, batch in enumerate(dataloader):
+        assert isinstance(batch, TensorDictBase)
+        assert batch.batch_size == torch.Size([batch_size])
+        expected = torch.arange(i * batch_size, (i + 1) * batch_size, device=device)
+        assert (batch.get("a")[:, 0] == expected).all()
+        num_batches += 1
+    assert num_batches == n // batch_size
+
+
 @pytest.mark.parametrize("device", get_available_devices())
 def test_savedtensordict(device):
     vals = [torch.randn(3, 1, device=device) for _ in range(4)]
@@ -908,6 +1011,9 @@ class TestTensorDicts(TestTensorDictsBase):
         td = getattr(self, td_name)(device)
         if td_name != "saved_td":
             td.pin_memory()
+            if td_name == "td" and device == torch.device("cpu"):
+                # integer tensors (e.g. uint8 images, int64 labels) must be pinned too
+                assert td.get("c").is_pinned()
             td_device = td.to(device_cast)
             _device_cast = torch.device(device_cast)
             assert td_device.device == _device_cast